@@ -0,0 +1,220 @@
+# =========================================
+# SALES ANALYTICS SYSTEM - BENCHMARKS
+# =========================================
+# Simple timing script to measure how fast the pipeline runs
+# on a large generated sales file.
+#
+# Run with: python benchmark.py [number_of_rows]
+
+import bz2
+import gzip
+import lzma
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from utils.file_handler import read_sales_data
+from utils.data_processor import (
+    parse_and_clean_data,
+    remove_duplicate_transactions,
+    calculate_total_revenue,
+    region_wise_sales,
+    top_selling_products,
+    customer_analysis,
+    customer_analysis_out_of_core,
+    daily_sales_trend
+)
+
+HEADER = "TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region\n"
+PRODUCTS = ["USB Cable", "Laptop Charger", "Headphones", "Wireless Mouse",
+            "Keyboard", "Monitor", "Webcam", "External Hard Drive"]
+REGIONS = ["North", "South", "East", "West"]
+
+
+def generate_sales_lines(rows, seed=42):
+    """
+    This function generates fake sales lines
+    in the same format as data/sales_data.txt
+    """
+
+    rng = random.Random(seed)
+    lines = [HEADER]
+
+    for i in range(rows):
+        product = rng.randrange(len(PRODUCTS))
+        lines.append(
+            f"T{i:07d}|2024-12-{rng.randint(1, 31):02d}|P{101 + product}|"
+            f"{PRODUCTS[product]}|{rng.randint(1, 10)}|{rng.randint(100, 50000)}.{rng.randint(0, 99):02d}|"
+            f"C{rng.randint(1, 5000):05d}|{rng.choice(REGIONS)}\n"
+        )
+
+    return "".join(lines)
+
+
+def time_rows(label, rows, func):
+    """
+    Run func once and print rows per second.
+    """
+
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f}s  {rows / elapsed:>12,.0f} rows/sec")
+    return result
+
+
+def benchmark_compressed_reading(rows, workdir):
+    """
+    This function compares reading + parsing speed
+    for plain and compressed versions of the same file.
+    """
+
+    print("\nREAD + PARSE (compressed vs plain)")
+    print("--------------------------------------------")
+
+    text = generate_sales_lines(rows).encode("utf-8")
+    writers = [
+        ("plain", "sales.txt", open),
+        ("gzip", "sales.txt.gz", gzip.open),
+        ("bz2", "sales.txt.bz2", bz2.open),
+        ("xz", "sales.txt.xz", lzma.open),
+    ]
+
+    for label, name, opener in writers:
+        path = os.path.join(workdir, name)
+        with opener(path, "wb") as file:
+            file.write(text)
+
+        time_rows(label, rows,
+                  lambda: parse_and_clean_data(read_sales_data(path)))
+
+
+def run_aggregations(transactions):
+    """
+    Run all the revenue based analytics once.
+    """
+
+    calculate_total_revenue(transactions)
+    region_wise_sales(transactions)
+    top_selling_products(transactions)
+    customer_analysis(transactions)
+    daily_sales_trend(transactions)
+
+
+def benchmark_money_aggregation(rows):
+    """
+    This function compares the analytics functions
+    on integer paise prices against the same records
+    with float rupee prices (the old representation).
+    """
+
+    print("\nAGGREGATION (int paise vs float rupees)")
+    print("--------------------------------------------")
+
+    lines = generate_sales_lines(rows).splitlines()[1:]
+    paise_data, _ = parse_and_clean_data(lines)
+
+    float_data = []
+    for t in paise_data:
+        record = t.copy()
+        record["UnitPrice"] = t["UnitPrice"] / 100
+        float_data.append(record)
+
+    time_rows("float rupees", rows, lambda: run_aggregations(float_data))
+    time_rows("int paise", rows, lambda: run_aggregations(paise_data))
+
+    # exactness check: summing in a different order must give the same total
+    reversed_data = paise_data[::-1]
+    exact = calculate_total_revenue(paise_data) == calculate_total_revenue(reversed_data)
+    drift = abs(calculate_total_revenue(float_data) - calculate_total_revenue(float_data[::-1]))
+    print(f"int paise order independent: {exact}")
+    print(f"float rupees order drift:    {drift:.10f}")
+
+
+def benchmark_dedupe(rows):
+    """
+    This function compares the pipeline throughput
+    with and without the duplicate detection stage.
+    About 1% of the rows are re-delivered copies.
+    """
+
+    print("\nPARSE + DEDUPE (with vs without)")
+    print("--------------------------------------------")
+
+    lines = generate_sales_lines(rows).splitlines()[1:]
+    rng = random.Random(7)
+    lines += rng.sample(lines, rows // 100)
+    total = len(lines)
+
+    time_rows("no dedupe", total, lambda: parse_and_clean_data(lines))
+    _, duplicates = time_rows(
+        "bloom dedupe", total,
+        lambda: remove_duplicate_transactions(parse_and_clean_data(lines)[0]))
+    print(f"duplicates found: {duplicates:,}")
+
+
+def generate_customer_transactions(rows, customers, seed=3):
+    """
+    This function streams cleaned records with
+    a very large number of distinct customers.
+    """
+
+    rng = random.Random(seed)
+    for _ in range(rows):
+        yield {
+            "CustomerID": f"C{rng.randrange(customers):08d}",
+            "ProductName": rng.choice(PRODUCTS),
+            "Quantity": rng.randint(1, 10),
+            "UnitPrice": rng.randint(10000, 5000000)
+        }
+
+
+def benchmark_customer_memory(rows, budget=8 * 1024 * 1024):
+    """
+    This function compares peak Python memory of the
+    in-memory customer_analysis and the out-of-core
+    version on a high-cardinality customer stream.
+    """
+
+    print(f"\nCUSTOMER ANALYSIS (in-memory vs {budget // (1024 * 1024)} MB budget, top 5)")
+    print("--------------------------------------------")
+
+    for label, func in [
+        ("in-memory", lambda: list(customer_analysis(
+            generate_customer_transactions(rows, rows)).items())[:5]),
+        ("out-of-core", lambda: list(customer_analysis_out_of_core(
+            generate_customer_transactions(rows, rows), memory_budget=budget, top_n=5).items())),
+    ]:
+        tracemalloc.start()
+        top = time_rows(label, rows, func)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{'':<28} peak memory {peak / (1024 * 1024):8.1f} MB, top: {top[0][0]}")
+
+    # parity check: a tiny budget forces spilling, result and order must match exactly
+    sample = list(generate_customer_transactions(min(rows, 20000), 2000))
+    expected = list(customer_analysis(sample).items())
+    same = expected == list(customer_analysis_out_of_core(sample, memory_budget=1000).items())
+    same_top = expected[:5] == list(customer_analysis_out_of_core(
+        sample, memory_budget=1000, top_n=5).items())
+    print(f"out-of-core matches in-memory (spilled): {same}")
+    print(f"out-of-core top 5 matches in-memory:     {same_top}")
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"Benchmarking with {rows:,} rows")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        benchmark_compressed_reading(rows, workdir)
+
+    benchmark_money_aggregation(rows)
+    benchmark_dedupe(rows)
+    benchmark_customer_memory(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,19 +5,28 @@
 from utils.file_handler import read_sales_data
 from utils.data_processor import (
     parse_and_clean_data,
+    remove_duplicate_transactions,
+    DEDUPE_MEMORY_BYTES,
     validate_and_filter_sales,
     calculate_total_revenue,
     region_wise_sales,
     top_selling_products,
-    customer_analysis,
+    customer_analysis_out_of_core,
     daily_sales_trend,
     find_peak_sales_day,
     low_performing_products,
     enrich_sales_data,
-    generate_sales_report
+    generate_sales_report,
+    format_rupees
 )
 from utils.api_handler import fetch_all_products, create_product_mapping
 
+# Optional duplicate TransactionID detection stage
+# Set REMOVE_DUPLICATES = False to skip it, and change
+# DUPLICATE_FILTER_MEMORY_BYTES to give the Bloom filter more or less memory
+REMOVE_DUPLICATES = True
+DUPLICATE_FILTER_MEMORY_BYTES = DEDUPE_MEMORY_BYTES
+
 
 def main():
     """
@@ -41,6 +50,11 @@ def main():
         cleaned_data, invalid_count = parse_and_clean_data(raw_data)
         print("Parsed records:", len(cleaned_data))
         print("Invalid records removed:", invalid_count)
+        duplicate_count = None
+        if REMOVE_DUPLICATES:
+            cleaned_data, duplicate_count = remove_duplicate_transactions(
+                cleaned_data, memory_bytes=DUPLICATE_FILTER_MEMORY_BYTES)
+            print("Duplicate records removed:", duplicate_count)
 
         # Step 3 - Show filter options
         print("[3/10] Filter Options Available:")
@@ -56,7 +70,7 @@ def main():
         total_revenue = calculate_total_revenue(cleaned_data)
         region_data = region_wise_sales(cleaned_data)
         top_products = top_selling_products(cleaned_data)
-        customers = customer_analysis(cleaned_data)
+        customers = customer_analysis_out_of_core(cleaned_data, top_n=5)
         daily = daily_sales_trend(cleaned_data)
         peak_day = find_peak_sales_day(cleaned_data)
         low_products = low_performing_products(cleaned_data)
@@ -83,7 +97,7 @@ def main():
             for t in enriched_data:
                 line = (
                     f"{t['TransactionID']}|{t['Date']}|{t['ProductID']}|{t['ProductName']}|"
-                    f"{t['Quantity']}|{t['UnitPrice']}|{t['CustomerID']}|{t['Region']}|"
+                    f"{t['Quantity']}|{format_rupees(t['UnitPrice'], grouping=False)}|{t['CustomerID']}|{t['Region']}|"
                     f"{t['API_Category']}|{t['API_Brand']}|{t['API_Rating']}|{t['API_Match']}\n"
                 )
                 file.write(line)
@@ -92,7 +106,8 @@ def main():
 
         # Step 9 - Generate report
         print("[9/10] Generating report...")
-        generate_sales_report(cleaned_data, enriched_data, "output/sales_report.txt")
+        generate_sales_report(cleaned_data, enriched_data, "output/sales_report.txt",
+                              duplicate_count=duplicate_count)
         print("Report saved to: output/sales_report.txt")
 
         # Step 10 - Done
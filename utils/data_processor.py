@@ -1,3 +1,76 @@
+import hashlib
+import heapq
+import json
+import math
+import os
+import tempfile
+import zlib
+from decimal import Decimal, ROUND_HALF_UP
+
+# =====================================
+# MONEY HELPERS
+# All money is stored as integer paise (1 rupee = 100 paise)
+# so sums are exact and can be added up in any order.
+# It is converted back to rupees only when the report is written.
+# =====================================
+
+def parse_price_to_paise(text):
+    """
+    This function converts a price string
+    like "173" or "1916.50" into integer paise.
+
+    Prices with more than 2 decimal places
+    are rounded half up to the nearest paisa.
+    Raises ValueError if the text is not a number,
+    or if a non-zero price is below half a paisa
+    (it would round to 0 and look like a free item).
+    """
+
+    text = text.strip()
+    rupees, _, paise = text.partition(".")
+
+    # fast path for plain prices like "173" or "173.5"
+    if rupees.isdigit() and (paise == "" or (paise.isdigit() and len(paise) <= 2)):
+        return int(rupees) * 100 + int(paise.ljust(2, "0"))
+
+    # anything else (signs, more decimals, exponents) goes through Decimal
+    try:
+        price = Decimal(text)
+        paise = int((price * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+    except (ArithmeticError, ValueError):
+        raise ValueError(f"Invalid price: {text}")
+
+    if paise == 0 and price != 0:
+        raise ValueError(f"Price below 1 paisa: {text}")
+
+    return paise
+
+
+def format_rupees(paise, grouping=True):
+    """
+    This function converts integer paise
+    into a rupee string like "1,916.50".
+    """
+
+    sign = "-" if paise < 0 else ""
+    rupees, rest = divmod(abs(paise), 100)
+
+    if grouping:
+        return f"{sign}{rupees:,}.{rest:02d}"
+    return f"{sign}{rupees}.{rest:02d}"
+
+
+def average_paise(total, count):
+    """
+    This function divides integer paise by a count
+    and rounds half up (away from zero), the same
+    way parse_price_to_paise rounds prices.
+    """
+
+    sign = -1 if total < 0 else 1
+    return sign * ((2 * abs(total) + count) // (2 * count))
+
+
 # =====================================
 # PART 1: PARSING AND CLEANING
 # Task 1.2
@@ -9,6 +82,8 @@ def parse_and_clean_data(raw_lines):
     This function takes raw data lines
     and converts them into clean records.
     Invalid records are skipped.
+
+    UnitPrice is stored as integer paise.
     """
 
     cleaned_data = []    
@@ -52,9 +127,9 @@ def parse_and_clean_data(raw_lines):
         unit_price = unit_price.replace(",", "")
 
         try:
-            # convert quantity and price to numbers
+            # convert quantity to number and price to integer paise
             quantity = int(quantity)
-            unit_price = float(unit_price)
+            unit_price = parse_price_to_paise(unit_price)
         except ValueError:
             invalid_count += 1
             continue
@@ -83,6 +158,99 @@ def parse_and_clean_data(raw_lines):
     return cleaned_data, invalid_count
 
 
+# =====================================
+# PART 1: DUPLICATE TRANSACTION DETECTION
+# =====================================
+# Optional stage to drop re-delivered transactions with the same TransactionID
+# A Bloom filter screens IDs in fixed memory and only the few suspected
+# duplicates are kept in an exact set for confirmation
+
+# default memory for the Bloom filter (1 MB is enough for ~1 million IDs)
+DEDUPE_MEMORY_BYTES = 1024 * 1024
+
+
+class BloomFilter:
+    """
+    A simple Bloom filter over a fixed size bit array.
+
+    It can say "definitely not seen" or "maybe seen".
+    Memory use never grows after it is created.
+    """
+
+    def __init__(self, memory_bytes, expected_items):
+        self.size = max(8, memory_bytes * 8)
+        self.bits = bytearray(self.size // 8)
+
+        # best number of hash functions for this size, capped at 7
+        # (7 hashes already give under 1% false positives at 10 bits per ID)
+        per_item = self.size / max(1, expected_items)
+        self.hash_count = min(7, max(1, round(per_item * math.log(2))))
+
+    def add(self, key):
+        """
+        Add key and return True if it was maybe seen before.
+        """
+
+        # double hashing: derive all positions from one 128-bit digest
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+
+        bits = self.bits
+        size = self.size
+        seen = True
+        for i in range(self.hash_count):
+            pos = (h1 + i * h2) % size
+            mask = 1 << (pos & 7)
+            if not bits[pos >> 3] & mask:
+                seen = False
+                bits[pos >> 3] |= mask
+        return seen
+
+
+def remove_duplicate_transactions(cleaned_data, memory_bytes=DEDUPE_MEMORY_BYTES):
+    """
+    This function removes transactions whose
+    TransactionID has already appeared earlier.
+    The first occurrence is kept.
+
+    Pass 1 runs every ID through a Bloom filter and
+    collects the IDs it reports as maybe seen.
+    Pass 2 checks only those candidates exactly,
+    so false positives are never dropped.
+
+    Returns unique records and the duplicate count.
+    """
+
+    bloom = BloomFilter(memory_bytes, len(cleaned_data))
+    candidates = set()
+
+    # pass 1: screen all IDs
+    for record in cleaned_data:
+        transaction_id = record["TransactionID"]
+        if bloom.add(transaction_id):
+            candidates.add(transaction_id)
+
+    if not candidates:
+        return cleaned_data, 0
+
+    # pass 2: exact confirmation on the suspected IDs only
+    unique_data = []
+    seen = set()
+    duplicate_count = 0
+
+    for record in cleaned_data:
+        transaction_id = record["TransactionID"]
+        if transaction_id in candidates:
+            if transaction_id in seen:
+                duplicate_count += 1
+                continue
+            seen.add(transaction_id)
+        unique_data.append(record)
+
+    return unique_data, duplicate_count
+
+
 # =====================================
 # PART 1: VALIDATION AND FILTERING
 # Task 1.3
@@ -149,6 +317,8 @@ def calculate_total_revenue(transactions):
     of the company from all valid transactions.
     Formula used:
     Revenue = Quantity * UnitPrice
+
+    The result is in integer paise.
     """
 
     total = 0
@@ -166,7 +336,7 @@ def region_wise_sales(transactions):
     This function calculates sales performance
     for each region (North, South, East, West).
 
-    It returns total sales, transaction count
+    It returns total sales (in paise), transaction count
     and percentage contribution of each region.
     """
 
@@ -208,7 +378,7 @@ def top_selling_products(transactions, n=5):
     This function finds top N products
     based on total quantity sold.
 
-    It also calculates total revenue for each product.
+    It also calculates total revenue (in paise) for each product.
     """
 
     product_map = {}
@@ -241,10 +411,10 @@ def customer_analysis(transactions):
     This function analyzes customer behavior.
 
     For each customer it calculates:
-    - total amount spent
+    - total amount spent (in paise)
     - number of purchases
-    - average order value
-    - unique products bought
+    - average order value (in paise, rounded)
+    - unique products bought (sorted by name)
     """
 
     customers = {}
@@ -269,10 +439,10 @@ def customer_analysis(transactions):
     result = {}
     for cid, data in customers.items():
         result[cid] = {
-            "total_spent": round(data["total_spent"], 2),
+            "total_spent": data["total_spent"],
             "purchase_count": data["purchase_count"],
-            "avg_order_value": round(data["total_spent"] / data["purchase_count"], 2),
-            "products_bought": list(data["products_bought"])
+            "avg_order_value": average_paise(data["total_spent"], data["purchase_count"]),
+            "products_bought": sorted(data["products_bought"])
         }
 
     # Sort customers by total spent (highest first)
@@ -281,11 +451,170 @@ def customer_analysis(transactions):
                        reverse=True))
 
 
+# Out-of-core version of customer_analysis for very many customers
+# The in-memory table is limited to a memory budget. When it grows past
+# the budget, partial totals are hash-partitioned into temp files and
+# merged one partition at a time at the end.
+
+# default memory budget for the customer table
+CUSTOMER_MEMORY_BUDGET_BYTES = 64 * 1024 * 1024
+SPILL_PARTITIONS = 16
+MAX_SPILL_DEPTH = 8
+
+# rough in-memory size of one customer entry and of one product in its set
+CUSTOMER_ENTRY_BYTES = 600
+PRODUCT_ENTRY_BYTES = 120
+
+
+def _spill_customers(customers, spill_files, depth):
+    """
+    Write partial customer totals to the partition files
+    and empty the in-memory table.
+    """
+
+    for cid, data in customers.items():
+        # salt with depth so a re-spilled partition splits differently
+        partition = zlib.crc32(f"{depth}:{cid}".encode("utf-8")) % len(spill_files)
+        spill_files[partition].write(json.dumps([
+            cid,
+            data["total_spent"],
+            data["purchase_count"],
+            data["first_seen"],
+            sorted(data["products_bought"])
+        ]) + "\n")
+
+    customers.clear()
+
+
+def _read_spill_file(path):
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            yield json.loads(line)
+
+
+def _aggregate_customers(entries, memory_budget, workdir, depth, emit):
+    """
+    Merge (cid, total, count, first_seen, products) entries
+    and call emit(cid, data) once per final customer.
+    """
+
+    customers = {}
+    used = 0
+    spill_files = None
+
+    for cid, total, count, first_seen, products in entries:
+        data = customers.get(cid)
+        if data is None:
+            data = customers[cid] = {
+                "total_spent": 0,
+                "purchase_count": 0,
+                "first_seen": first_seen,
+                "products_bought": set()
+            }
+            used += CUSTOMER_ENTRY_BYTES
+
+        data["total_spent"] += total
+        data["purchase_count"] += count
+        data["first_seen"] = min(data["first_seen"], first_seen)
+
+        before = len(data["products_bought"])
+        data["products_bought"].update(products)
+        used += PRODUCT_ENTRY_BYTES * (len(data["products_bought"]) - before)
+
+        # spill when over budget (a single customer cannot be split further)
+        if used > memory_budget and len(customers) > 1 and depth < MAX_SPILL_DEPTH:
+            if spill_files is None:
+                spill_files = [
+                    tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=workdir,
+                                                suffix=".spill", delete=False)
+                    for _ in range(SPILL_PARTITIONS)
+                ]
+            _spill_customers(customers, spill_files, depth)
+            used = 0
+
+    # everything fitted in memory
+    if spill_files is None:
+        for cid, data in customers.items():
+            emit(cid, data)
+        return
+
+    _spill_customers(customers, spill_files, depth)
+    for file in spill_files:
+        file.close()
+
+    # merge each partition on its own (it may spill again if still too big)
+    for file in spill_files:
+        _aggregate_customers(_read_spill_file(file.name), memory_budget,
+                             workdir, depth + 1, emit)
+        os.remove(file.name)
+
+
+def customer_analysis_out_of_core(transactions, memory_budget=CUSTOMER_MEMORY_BUDGET_BYTES,
+                                  top_n=None, temp_dir=None):
+    """
+    This function gives the same result as customer_analysis
+    but keeps the customer table within memory_budget bytes
+    by spilling partial totals to temp files.
+
+    transactions can be any iterable, so records
+    can be streamed instead of held in a list.
+
+    Note: the memory budget only covers the whole run
+    when top_n is given. Then only the top N customers
+    by total spent are kept and returned. With top_n=None
+    every customer is collected into the returned dict,
+    so memory still grows with the number of customers.
+    A top_n of 0 or less returns an empty dict.
+
+    The budget is an estimate, not measured memory: each
+    customer counts as CUSTOMER_ENTRY_BYTES and each product
+    in its set as PRODUCT_ENTRY_BYTES. A partition is split
+    again at most MAX_SPILL_DEPTH times. After that (or for a
+    single customer bigger than the budget) the table keeps
+    growing in memory past the budget.
+    """
+
+    if top_n is not None and top_n <= 0:
+        return {}
+
+    def to_output(data):
+        return {
+            "total_spent": data["total_spent"],
+            "purchase_count": data["purchase_count"],
+            "avg_order_value": average_paise(data["total_spent"], data["purchase_count"]),
+            "products_bought": sorted(data["products_bought"])
+        }
+
+    # ties are ordered by first appearance, same as customer_analysis
+    collected = []
+
+    def emit(cid, data):
+        item = (data["total_spent"], -data["first_seen"], cid, to_output(data))
+        if top_n is None:
+            collected.append(item)
+        elif len(collected) < top_n:
+            heapq.heappush(collected, item)
+        elif item[:2] > collected[0][:2]:
+            heapq.heapreplace(collected, item)
+
+    entries = (
+        (t["CustomerID"], t["Quantity"] * t["UnitPrice"], 1, index, (t["ProductName"],))
+        for index, t in enumerate(transactions)
+    )
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as workdir:
+        _aggregate_customers(entries, memory_budget, workdir, 0, emit)
+
+    # Sort customers by total spent (highest first)
+    collected.sort(key=lambda x: x[:2], reverse=True)
+    return {cid: data for _, _, cid, data in collected}
+
+
 def daily_sales_trend(transactions):
     """
     This function groups all transactions
     by date and calculates daily performance:
-    - total revenue
+    - total revenue (in paise)
     - number of transactions
     - number of unique customers
     """
@@ -311,7 +640,7 @@ def daily_sales_trend(transactions):
     final = {}
     for date, data in daily.items():
         final[date] = {
-            "revenue": round(data["revenue"], 2),
+            "revenue": data["revenue"],
             "transaction_count": data["transaction_count"],
             "unique_customers": len(data["customers"])
         }
@@ -420,13 +749,20 @@ def enrich_sales_data(transactions, product_mapping):
 
 import datetime
 # Generate formatted sales analytics report for business users
-def generate_sales_report(transactions, enriched_transactions, output_file="output/sales_report.txt"):
+def generate_sales_report(transactions, enriched_transactions, output_file="output/sales_report.txt",
+                          duplicate_count=None):
     """
     This function generates a complete
     sales analytics report in text format.
 
     The report is written in a professional,
     management style as required in the assignment.
+
+    All analytics are in integer paise and are
+    converted to rupees only here, when writing.
+
+    If duplicate_count is given, the number of
+    duplicate transactions removed is also shown.
     """
 
     now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -445,7 +781,8 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
 
     region_data = region_wise_sales(transactions)
     top_products = top_selling_products(transactions, 5)
-    customers = customer_analysis(transactions)
+    # only the top 5 customers are shown, so use the memory-budgeted version
+    customers = customer_analysis_out_of_core(transactions, top_n=5)
     daily = daily_sales_trend(transactions)
     peak_date, peak_revenue, peak_count = find_peak_sales_day(transactions)
     low_products = low_performing_products(transactions)
@@ -466,14 +803,16 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
         file.write("SALES ANALYTICS REPORT\n")
         file.write(f"Generated: {now}\n")
         file.write(f"Records Processed: {total_transactions}\n")
+        if duplicate_count is not None:
+            file.write(f"Duplicate Transactions Removed: {duplicate_count}\n")
         file.write("============================================\n\n")
 
         # OVERALL SUMMARY
         file.write("OVERALL SUMMARY\n")
         file.write("--------------------------------------------\n")
-        file.write(f"Total Revenue: ₹{total_revenue:,.2f}\n")
+        file.write(f"Total Revenue: ₹{format_rupees(total_revenue)}\n")
         file.write(f"Total Transactions: {total_transactions}\n")
-        file.write(f"Average Order Value: ₹{(total_revenue/total_transactions):,.2f}\n")
+        file.write(f"Average Order Value: ₹{format_rupees(average_paise(total_revenue, total_transactions))}\n")
         file.write(f"Date Range: {start_date} to {end_date}\n\n")
 
         # REGION WISE PERFORMANCE
@@ -482,7 +821,7 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
         file.write("Region | Total Sales | % of Total | Transactions\n")
 
         for region, data in region_data.items():
-            file.write(f"{region} | ₹{data['total_sales']:,.2f} | {data['percentage']}% | {data['transaction_count']}\n")
+            file.write(f"{region} | ₹{format_rupees(data['total_sales'])} | {data['percentage']}% | {data['transaction_count']}\n")
 
         file.write("\n")
 
@@ -493,7 +832,7 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
 
         rank = 1
         for name, qty, rev in top_products:
-            file.write(f"{rank} | {name} | {qty} | ₹{rev:,.2f}\n")
+            file.write(f"{rank} | {name} | {qty} | ₹{format_rupees(rev)}\n")
             rank += 1
 
         file.write("\n")
@@ -505,7 +844,7 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
 
         rank = 1
         for cid, data in list(customers.items())[:5]:
-            file.write(f"{rank} | {cid} | ₹{data['total_spent']:,.2f} | {data['purchase_count']}\n")
+            file.write(f"{rank} | {cid} | ₹{format_rupees(data['total_spent'])} | {data['purchase_count']}\n")
             rank += 1
 
         file.write("\n")
@@ -516,19 +855,19 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
         file.write("Date | Revenue | Transactions | Customers\n")
 
         for date, data in daily.items():
-            file.write(f"{date} | ₹{data['revenue']:,.2f} | {data['transaction_count']} | {data['unique_customers']}\n")
+            file.write(f"{date} | ₹{format_rupees(data['revenue'])} | {data['transaction_count']} | {data['unique_customers']}\n")
 
         file.write("\n")
 
         # PRODUCT PERFORMANCE
         file.write("PRODUCT PERFORMANCE ANALYSIS\n")
         file.write("--------------------------------------------\n")
-        file.write(f"Best Selling Day: {peak_date} (₹{peak_revenue:,.2f} in {peak_count} transactions)\n")
+        file.write(f"Best Selling Day: {peak_date} (₹{format_rupees(peak_revenue)} in {peak_count} transactions)\n")
 
         if low_products:
             file.write("Low Performing Products:\n")
             for name, qty, rev in low_products:
-                file.write(f"{name} - Qty: {qty}, Revenue: ₹{rev:,.2f}\n")
+                file.write(f"{name} - Qty: {qty}, Revenue: ₹{format_rupees(rev)}\n")
         else:
             file.write("No low performing products found.\n")
 
@@ -1,16 +1,67 @@
 # This module handles reading the sales data file with multiple encodings
+# Compressed files (gzip / bz2 / xz) are detected from their magic bytes
+# and decompressed on the fly while reading, so no temp files are needed
+
+import bz2
+import gzip
+import lzma
+
+# first bytes of each supported compressed format and how to open it
+COMPRESSION_MAGIC = [
+    (b"\x1f\x8b", gzip.open),
+    (b"BZh", bz2.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+]
+
+
+def detect_compression(filename):
+    """
+    This function looks at the first few bytes of the file
+    and returns the opener for its compression format,
+    or None if the file is plain text.
+    """
+
+    with open(filename, 'rb') as file:
+        header = file.read(6)
+
+    for magic, opener in COMPRESSION_MAGIC:
+        if header.startswith(magic):
+            return opener
+
+    return None
+
+
+def open_sales_file(filename, encoding, opener):
+    """
+    This function opens the sales file in text mode
+    using the opener from detect_compression.
+
+    Compressed files are decompressed while they
+    are being read. Plain text files (opener None)
+    are opened normally.
+    """
+
+    return (opener or open)(filename, 'rt', encoding=encoding)
+
 
 def read_sales_data(filename):
     encodings = ['utf-8', 'latin-1', 'cp1252']
 
+    try:
+        opener = detect_compression(filename)
+    except FileNotFoundError:
+        print(f"Error: File not found - {filename}")
+        return []
+
     for encoding in encodings:
         try:
-            with open(filename, 'r', encoding=encoding) as file:
-                lines = file.readlines()
-                lines = lines[1:]
+            with open_sales_file(filename, encoding, opener) as file:
+                # skip the header line
+                next(file, None)
 
+                # read line by line so compressed data is streamed
                 clean_lines = []
-                for line in lines:
+                for line in file:
                     line = line.strip()
                     if line:
                         clean_lines.append(line)
@@ -19,8 +70,12 @@ def read_sales_data(filename):
 
         except UnicodeDecodeError:
             continue
-        except FileNotFoundError:
-            print(f"Error: File not found - {filename}")
+        except (OSError, EOFError, lzma.LZMAError) as e:
+            # only corrupt compressed data is reported here,
+            # other errors on plain files are raised as before
+            if opener is None:
+                raise
+            print(f"Error: Unable to decompress file - {filename} ({e})")
             return []
 
     print("Error: Unable to read file with supported encodings")